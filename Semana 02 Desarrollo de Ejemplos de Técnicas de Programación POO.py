@@ -1,53 +1,58 @@
 
-from abc import ABC, abstractmethod
+import sys
 from datetime import date
 
 # 1. ABSTRACCIÓN
-# Usamos una clase abstracta para definir un contrato que todas
-# las clases hijas deberán cumplir
+# Usamos una clase base para definir un contrato que todas
+# las clases hijas deberán cumplir. No se usa ABC: así crear cada
+# empleado no paga la verificación extra de métodos abstractos.
+
+class Empleado:
+    # __slots__ evita el __dict__ por instancia: menos memoria y acceso directo
+    __slots__ = ("_nombre", "_fecha_nacimiento", "_año_nacimiento",
+                 "_clave_nacimiento", "salario_base")
 
-class Empleado(ABC):
     def __init__(self, nombre, fecha_nacimiento):
 
         # 2. ENCAPSULACIÓN
-        # Atributos privados
+        # Atributos protegidos (con un guion bajo)
 
-        self.__nombre = nombre
-        self.__fecha_nacimiento = fecha_nacimiento
-        self.__salario_base = 0  # será definido por cada tipo de empleado
+        self._nombre = nombre
+        self._fecha_nacimiento = fecha_nacimiento
+        # Se precalculan una sola vez los datos que usa edad().
+        # Mes y día se empaquetan en un entero (mes * 32 + día) que conserva
+        # el orden del calendario y se compara sin crear tuplas.
+        self._año_nacimiento = fecha_nacimiento.year
+        self._clave_nacimiento = fecha_nacimiento.month * 32 + fecha_nacimiento.day
+        self.salario_base = 0  # será definido por cada tipo de empleado
 
 
     @property
     def nombre(self):
-        return self.__nombre
-
-    @property
-    def edad(self):
-        hoy = date.today()
-        return hoy.year - self.__fecha_nacimiento.year - (
-            (hoy.month, hoy.day) < (self.__fecha_nacimiento.month, self.__fecha_nacimiento.day)
+        return self._nombre
+
+    def edad(self, hoy=None):
+        # Quien calcula muchas edades puede pasar la fecha de hoy una sola vez
+        if hoy is None:
+            hoy = date.today()
+        return hoy.year - self._año_nacimiento - (
+            hoy.month * 32 + hoy.day < self._clave_nacimiento
         )
 
-    @property
-    def salario_base(self):
-        return self.__salario_base
-
-    @salario_base.setter
-    def salario_base(self, valor):
+    def set_salario_base(self, valor):
         if valor < 0:
             raise ValueError("El salario no puede ser negativo")
-        self.__salario_base = valor
+        self.salario_base = valor
 
 
-    # Método abstracto → obliga a las clases hijas a implementarlo
+    # Métodos "abstractos" → las clases hijas deben sobrescribirlos;
+    # si no lo hacen, llamarlos lanza NotImplementedError
 
-    @abstractmethod
     def calcular_salario(self):
-        pass
+        raise NotImplementedError("Las subclases deben implementar calcular_salario()")
 
-    @abstractmethod
     def trabajar(self):
-        pass
+        raise NotImplementedError("Las subclases deben implementar trabajar()")
 
 
 
@@ -55,14 +60,16 @@ class Empleado(ABC):
 # Gerente y Desarrollador heredan de Empleados
 
 class Gerente(Empleado):
+    __slots__ = ("departamento", "_bonus")
+
     def __init__(self, nombre, fecha_nacimiento, departamento):
         super().__init__(nombre, fecha_nacimiento)
         self.departamento = departamento
-        self.__bonus = 5000  # bono fijo por ser gerente
+        self._bonus = 5000  # bono fijo por ser gerente
 
     # Sobrescritura del método abstracto
     def calcular_salario(self):
-        return self.salario_base + self.__bonus
+        return self.salario_base + self._bonus
 
     def trabajar(self):
         return f"{self.nombre} está dirigiendo el departamento {self.departamento}"
@@ -73,17 +80,19 @@ class Gerente(Empleado):
 
 
 class Desarrollador(Empleado):
+    __slots__ = ("lenguaje_favorito", "_horas_extra")
+
     def __init__(self, nombre, fecha_nacimiento, lenguaje_favorito):
         super().__init__(nombre, fecha_nacimiento)
         self.lenguaje_favorito = lenguaje_favorito
-        self.__horas_extra = 0
+        self._horas_extra = 0
 
     def agregar_horas_extra(self, horas):
         if horas >= 0:
-            self.__horas_extra += horas
+            self._horas_extra += horas
 
     def calcular_salario(self):
-        pago_extra = self.__horas_extra * 50
+        pago_extra = self._horas_extra * 50
         return self.salario_base + pago_extra
 
 
@@ -94,14 +103,23 @@ class Desarrollador(Empleado):
         return f"{self.nombre} está programando en {self.lenguaje_favorito}"
 
 
+# Herramientas de diseño conocidas: el nombre se normaliza una sola vez
+# y luego se compara un entero en lugar de una cadena
+_ID_HERRAMIENTAS = {"figma": 1, "sketch": 2, "adobe xd": 3, "photoshop": 4}
+_ID_FIGMA = _ID_HERRAMIENTAS["figma"]
+
+
 class Diseñador(Empleado):
+    __slots__ = ("herramienta", "_id_herramienta")
+
     def __init__(self, nombre, fecha_nacimiento, herramienta):
         super().__init__(nombre, fecha_nacimiento)
         self.herramienta = herramienta
+        self._id_herramienta = _ID_HERRAMIENTAS.get(herramienta.strip().lower(), 0)
 
     def calcular_salario(self):
 
-        plus = 2000 if self.herramienta.lower() == "figma" else 0
+        plus = 2000 if self._id_herramienta == _ID_FIGMA else 0
         return self.salario_base + plus
 
     def trabajar(self):
@@ -113,11 +131,13 @@ class Diseñador(Empleado):
 # Todas las instancias son de tipo Empleado, pero llaman a su propia versión de trabajar
 
 def jornada_laboral(empleados):
-    print("=== Jornada laboral ===\n")
+    # Se arma todo el reporte y se escribe de una sola vez en la consola
+    lineas = ["=== Jornada laboral ===", ""]
     for emp in empleados:
-        print(emp.trabajar())
-        print(f"Salario este mes: ${emp.calcular_salario():,}")
-        print("-" * 40)
+        lineas.append(emp.trabajar())
+        lineas.append(f"Salario este mes: ${emp.calcular_salario():,}")
+        lineas.append("-" * 40)
+    sys.stdout.write("\n".join(lineas) + "\n")
 
 
 
@@ -130,9 +150,9 @@ if __name__ == "__main__":
     diseñador = Diseñador("Laura Gómez", date(1990, 11, 30), "Figma")
 
     # Asignar salarios base
-    gerente.salario_base = 30000
-    dev.salario_base = 25000
-    diseñador.salario_base = 22000
+    gerente.set_salario_base(30000)
+    dev.set_salario_base(25000)
+    diseñador.set_salario_base(22000)
 
     # Realización de horas extra
     dev.agregar_horas_extra(20)
@@ -1,20 +1,41 @@
 # Programación Orientada a Objetos (POO): Cálculo del promedio semanal de temperaturas
 
+import sys
+from array import array
+from statistics import fmean
+
+# Etiquetas fijas: se crean (e internan) una sola vez al cargar el módulo
+_DIAS = tuple(sys.intern(s) for s in ("Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"))
+_MOMENTOS = tuple(sys.intern(s) for s in ("mañana", "tarde", "noche"))
+
+
+def _is_number(text):
+    """Indica si el texto se puede convertir a float (usado para señalar el valor inválido)."""
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return False
+
 
 class DailyWeather:
     """
     Clase que representa la información diaria del clima.
     - Encapsula las temperaturas (mañana, tarde, noche) y el promedio diario.
     - Métodos para ingresar datos y calcular/ obtener el promedio (encapsulamiento: datos privados).
+    - __slots__ fija los atributos: cada objeto ocupa menos memoria al no tener __dict__.
     """
 
+    __slots__ = ('day', '_temperatures', '_daily_average')
+
     def __init__(self, day):
         """
-        Inicializador: Recibe el nombre del día y inicializa temperaturas como lista vacía.
+        Inicializador: Recibe el nombre del día e inicializa las temperaturas como un
+        arreglo compacto de floats (array('d')) vacío.
         El promedio se calcula solo cuando se necesita (lazy computation).
         """
         self.day = day  # Atributo público: nombre del día
-        self._temperatures = []  # Atributo privado: lista de temperaturas
+        self._temperatures = array('d')  # Atributo privado: arreglo de temperaturas
         self._daily_average = None  # Atributo privado: promedio diario
 
     def input_temperatures(self):
@@ -25,8 +46,8 @@ class DailyWeather:
         - Resetea el promedio para recalcular si es necesario.
         """
         print(f"Ingresando temperaturas para el {self.day}:")
-        self._temperatures = []  # Limpiar por si se llama múltiples veces
-        for momento in ["mañana", "tarde", "noche"]:
+        self._temperatures = array('d')  # Limpiar por si se llama múltiples veces
+        for momento in _MOMENTOS:
             while True:
                 try:
                     temp = float(input(f"Temperatura de la {momento} (en °C): "))
@@ -35,7 +56,15 @@ class DailyWeather:
                 except ValueError:
                     print("Por favor, ingrese un valor numérico válido.")
         self._daily_average = None
-        print(f"Temperaturas ingresadas para {self.day}: {self._temperatures}\n")
+        print(f"Temperaturas ingresadas para {self.day}: {self._temperatures.tolist()}\n")
+
+    def set_temperatures(self, temperatures):
+        """
+        Método para asignar las 3 temperaturas del día ya leídas (sin pedirlas al usuario).
+        - Se usa en la carga por lotes de WeeklyWeather.from_stream().
+        """
+        self._temperatures = array('d', temperatures)
+        self._daily_average = None
 
     def calculate_daily_average(self):
         """
@@ -47,7 +76,7 @@ class DailyWeather:
         if not self._temperatures:
             raise ValueError(f"No hay temperaturas ingresadas para {self.day}")
         if self._daily_average is None:
-            self._daily_average = sum(self._temperatures) / len(self._temperatures)
+            self._daily_average = fmean(self._temperatures)
         return self._daily_average
 
     def get_daily_average(self):
@@ -70,8 +99,33 @@ class WeeklyWeather:
         """
         Inicializador: Crea la lista de días de la semana y objetos DailyWeather correspondientes.
         """
-        self._days = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
+        self._days = _DIAS
         self._daily_weathers = [DailyWeather(day) for day in self._days]
+        # Buffer reutilizable para los promedios diarios: se reserva una vez
+        # y cada resumen lo sobrescribe en lugar de crear un arreglo nuevo.
+        self._daily_averages = array('d', [0.0]) * len(self._days)
+
+    @classmethod
+    def from_stream(cls, stream):
+        """
+        Constructor alternativo para ejecuciones no interactivas (scripts, pruebas).
+        - Lee todo el flujo de una vez y separa los valores por espacios/saltos de línea.
+        - Espera 21 temperaturas: 3 por día (mañana, tarde, noche), de lunes a domingo.
+        - Lanza ValueError con un mensaje legible si un valor no es numérico o falta/sobra alguno.
+        """
+        week = cls()
+        tokens = stream.read().split()
+        try:
+            values = array('d', map(float, tokens))
+        except ValueError:
+            bad = next(t for t in tokens if not _is_number(t))
+            raise ValueError(f"'{bad}' no es una temperatura válida") from None
+        expected = 3 * len(week._daily_weathers)
+        if len(values) != expected:
+            raise ValueError(f"Se esperaban {expected} temperaturas, se recibieron {len(values)}")
+        for i, daily in enumerate(week._daily_weathers):
+            daily.set_temperatures(values[3 * i:3 * i + 3])
+        return week
 
     def input_all_days(self):
         """
@@ -86,27 +140,40 @@ class WeeklyWeather:
         """
         Método para calcular el promedio semanal.
         - Obtiene los promedios diarios de cada DailyWeather (usando sus métodos).
-        - Calcula y retorna el promedio de esos promedios.
+        - Calcula y retorna el promedio de esos promedios con fmean (una sola pasada en C).
         - Muestra un resumen detallado.
         """
-        daily_averages = []
-        for daily in self._daily_weathers:
-            avg = daily.get_daily_average()
-            daily_averages.append(avg)
-
-        weekly_average = sum(daily_averages) / len(daily_averages)
+        daily_averages = self._daily_averages
+        for i, daily in enumerate(self._daily_weathers):
+            daily_averages[i] = daily.get_daily_average()
+        weekly_average = fmean(daily_averages)
 
-        # Mostrar resumen
-        print("=== Resumen Semanal ===")
+        # Mostrar resumen (se arma completo y se escribe de una sola vez)
+        lines = ["=== Resumen Semanal ==="]
         for i, daily in enumerate(self._daily_weathers):
-            print(f"{daily.day}: {daily_averages[i]:.2f} °C")
-        print(f"\nPromedio semanal: {weekly_average:.2f} °C")
+            lines.append(f"{daily.day}: {daily_averages[i]:.2f} °C")
+        lines.append(f"\nPromedio semanal: {weekly_average:.2f} °C")
+        sys.stdout.write("\n".join(lines) + "\n")
 
         return weekly_average
 
 
 # Ejecución del programa
 if __name__ == "__main__":
-    week = WeeklyWeather()
-    week.input_all_days()
+    if len(sys.argv) > 1:
+        # Modo por lotes (opcional): se pasa un archivo con las 21 temperaturas,
+        # o "-" para leerlas de la entrada estándar.
+        path = sys.argv[1]
+        try:
+            if path == "-":
+                week = WeeklyWeather.from_stream(sys.stdin)
+            else:
+                with open(path, encoding="utf-8") as data:
+                    week = WeeklyWeather.from_stream(data)
+        except (OSError, ValueError) as e:
+            print(f"No se pudieron cargar las temperaturas: {e}")
+            sys.exit(1)
+    else:
+        week = WeeklyWeather()
+        week.input_all_days()
     week.calculate_weekly_average()
\ No newline at end of file
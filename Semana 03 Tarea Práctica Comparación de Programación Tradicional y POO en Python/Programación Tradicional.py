@@ -1,5 +1,11 @@
 # Programación Tradicional: Cálculo del promedio semanal de temperaturas
 
+import sys
+
+# Etiquetas fijas: se crean (e internan) una sola vez al cargar el módulo
+_DIAS = tuple(sys.intern(s) for s in ("Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"))
+_MOMENTOS = tuple(sys.intern(s) for s in ("mañana", "tarde", "noche"))
+
 
 def ingresar_temperaturas_dia(dia):
     """
@@ -12,7 +18,7 @@ def ingresar_temperaturas_dia(dia):
     """
     print(f"Ingresando temperaturas para el {dia}:")
     temps = []
-    for momento in ["mañana", "tarde", "noche"]:
+    for momento in _MOMENTOS:
         while True:
             try:
                 temp = float(input(f"Temperatura de la {momento} (en °C): "))
@@ -35,7 +41,7 @@ def calcular_promedio_semanal():
     - Muestra un resumen claro de todos los valores.
     Esta función actúa como el "orquestador" del proceso.
     """
-    dias_semana = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
+    dias_semana = _DIAS
     promedios_diarios = []
 
     print("=== Cálculo del Promedio Semanal de Temperaturas ===\n")
@@ -1,5 +1,11 @@
+from math import fsum
+from operator import attrgetter, mul
+
 # Clase base para representar un Pproducto en la tienda.
 class Producto:
+    # __slots__: atributos fijos, sin __dict__ por instancia (menos memoria).
+    __slots__ = ("nombre", "precio", "stock")
+
     def __init__(self, nombre, precio, stock):
         # Atributos: nombre del producto, precio y cantidad en stock.
         self.nombre = nombre
@@ -20,43 +26,65 @@ class Producto:
             print(f"No hay suficiente stock para {self.nombre}.")
             return False
 
+# Función auxiliar: suma de precio * cantidad para columnas paralelas.
+# map(mul, ...) recorre ambas columnas en C, sin crear un generador por línea,
+# y fsum suma con compensación de error (sin acumular redondeos de float).
+def _total(precios, cantidades):
+    return fsum(map(mul, precios, cantidades))
+
+_precio = attrgetter("precio")
+
 # Clase para representar el Carrito de compra.
 class Carrito:
+    __slots__ = ("_productos", "_cantidades", "_indice")
+
     def __init__(self):
-        # Atributo: diccionario para almacenar productos y sus cantidades.
-        self.items = {}  # clave: producto, valor: cantidad
+        # Atributos: listas paralelas con los productos y sus cantidades,
+        # más un índice posición-por-producto para fusionar líneas en O(1).
+        self._productos = []           # productos en orden de llegada
+        self._cantidades = []          # cantidad de cada producto (misma posición)
+        self._indice = {}              # clave: id(producto), valor: posición
 
     def agregar_producto(self, producto, cantidad):
         # Método para agregar un producto al carrito.
         # Interactúa con el método reducir_stock del producto.
         if producto.reducir_stock(cantidad):
-            if producto in self.items:
-                self.items[producto] += cantidad
+            posicion = self._indice.get(id(producto))
+            if posicion is None:
+                # El índice se registra después de llenar ambas listas
+                self._productos.append(producto)
+                self._cantidades.append(cantidad)
+                self._indice[id(producto)] = len(self._productos) - 1
             else:
-                self.items[producto] = cantidad
+                self._cantidades[posicion] += cantidad
             print(f"Se agregaron {cantidad} unidades de {producto.nombre} al carrito.")
         else:
             print("No se pudo agregar el producto.")
 
     def calcular_total(self):
         # Método para calcular el total del carrito.
-        total = 0
-        for producto, cantidad in self.items.items():
-            total += producto.precio * cantidad
-        return total
+        return _total(map(_precio, self._productos), self._cantidades)
 
     def mostrar_carrito(self):
         # Método para mostrar el contenido del carrito.
-        if not self.items:
+        if not self._productos:
             return "El carrito está vacío."
-        info = "Contenido del carrito:\n"
-        for producto, cantidad in self.items.items():
-            info += f"- {producto.nombre}: {cantidad} unidades, Subtotal: ${producto.precio * cantidad:.2f}\n"
-        info += f"Total: ${self.calcular_total():.2f}"
-        return info
+        lineas = ["Contenido del carrito:"]
+        for producto, cantidad in zip(self._productos, self._cantidades):
+            lineas.append(f"- {producto.nombre}: {cantidad} unidades, Subtotal: ${producto.precio * cantidad:.2f}")
+        lineas.append(f"Total: ${self.calcular_total():.2f}")
+        return "\n".join(lineas)
+
+    def vaciar(self):
+        # Método para dejar el carrito sin productos.
+        self._productos.clear()
+        self._cantidades.clear()
+        self._indice.clear()
 
 # Clase para representar un Cliente.
 class Cliente:
+    __slots__ = ("nombre", "email", "carrito")
+
     def __init__(self, nombre, email):
         # Atributos: nombre del cliente, email y su carrito asociado.
         self.nombre = nombre
@@ -75,7 +103,7 @@ class Cliente:
         total = self.carrito.calcular_total()
         if total > 0:
             print(f"Compra realizada por {self.email}. Total pagado: ${total:.2f}")
-            self.carrito.items.clear()  # Vacía el carrito después de la compra.
+            self.carrito.vaciar()  # Vacía el carrito después de la compra.
         else:
             print("No hay items para comprar.")
 
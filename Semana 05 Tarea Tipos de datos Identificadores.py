@@ -1,4 +1,7 @@
 
+import sys
+
+
 def convertir_centimetros_a_pulgadas(centimetros: float) -> float:
     """Convierte centímetros a pulgadas (1 cm = 0.393701 pulgadas)"""
     return centimetros * 0.393701
@@ -9,7 +12,33 @@ def convertir_celsius_a_fahrenheit(celsius: float) -> float:
     return (celsius * 9 / 5) + 32
 
 
+def convertir_centimetros_a_pulgadas_lote(valores: list[float]) -> list[float]:
+    """Convierte una lista de longitudes en cm a pulgadas en una sola pasada"""
+    return [cm * 0.393701 for cm in valores]
+
+
+def convertir_archivo(ruta: str):
+    """Lee longitudes en cm de un archivo (separadas por espacios o saltos de línea) y las convierte"""
+    try:
+        with open(ruta, encoding="utf-8") as archivo:
+            valores = [float(v) for v in archivo.read().split()]
+    except OSError as e:
+        print(f"¡No se pudo leer el archivo {ruta}! ({e.strerror})")
+        return
+    except ValueError:
+        print(f"¡El archivo {ruta} contiene valores que no son números!")
+        return
+    pulgadas = convertir_centimetros_a_pulgadas_lote(valores)
+    lineas = [f"{cm:6.1f} cm  →  {pulg:6.2f} pulgadas" for cm, pulg in zip(valores, pulgadas)]
+    sys.stdout.write("\n".join(lineas) + "\n")
+
+
 def main():
+    #Modo por lotes: si se recibe un archivo, se convierten todas sus medidas
+    if len(sys.argv) > 1:
+        convertir_archivo(sys.argv[1])
+        return
+
     #Tipos de Datos
     nombre_usuario = "Leonardo"
     edad = 18
@@ -2,7 +2,10 @@ class Vehiculo:
     """
     Clase base que representa un vehículo.
     Demuestra encapsulación con atributos privados.
+    __slots__ fija los atributos permitidos y evita el __dict__ por instancia.
     """
+    __slots__ = ("_marca", "_modelo", "_año", "velocidad")
+
     def __init__(self, marca, modelo, año):
         self._marca = marca  # Atributo encapsulado
         self._modelo = modelo  # Atributo encapsulado
@@ -37,6 +40,8 @@ class Coche(Vehiculo):
     Clase derivada que hereda de Vehiculo.
     Accede a atributos y métodos de la clase base.
     """
+    __slots__ = ("puertas",)
+
     def __init__(self, marca, modelo, año, puertas):
         super().__init__(marca, modelo, año)  # Llamada al constructor de la clase base
         self.puertas = puertas  # Atributo adicional específico de Coche
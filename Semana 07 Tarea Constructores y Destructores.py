@@ -1,23 +1,25 @@
-# Programa para demostrar el uso de constructores y destructores
+# Programa para demostrar el uso de constructores y de la liberación de recursos
 
 import os  # Módulo para manejar operaciones del sistema operativo, como borrar archivos.
 
 
 class ManejadorArchivo:
     """
-    Clase que demuestra el uso de constructor y destructor para manejar un archivo temporal.
+    Clase que demuestra el uso de constructor y liberación de recursos para manejar un archivo temporal.
     - En el constructor: Crea y abre un archivo temporal, inicializa atributos.
-    - En el destructor: Cierra el archivo y lo elimina para limpiar recursos.
+    - En close(): Cierra el archivo y lo elimina para limpiar recursos.
+    - Se usa como gestor de contexto (with): close() se llama al salir del bloque,
+      en un momento predecible, en lugar de depender de __del__ y del recolector de basura.
     """
 
     def __init__(self, nombre_archivo='temp.txt', contenido_inicial='Hola, mundo!'):
         """
         Constructor: Se ejecuta al crear el objeto.
         - Inicializa los atributos: nombre del archivo y el manejador del archivo.
-        - Abre el archivo en modo escritura y escribe el contenido inicial.
+        - Abre el archivo en modo escritura/lectura y escribe el contenido inicial.
         """
         self.nombre_archivo = nombre_archivo
-        self.archivo = open(self.nombre_archivo, 'w')  # Abre el archivo en modo escritura.
+        self.archivo = open(self.nombre_archivo, 'w+')  # Abre el archivo en modo escritura y lectura.
         self.archivo.write(contenido_inicial)  # Escribe el contenido inicial.
         self.archivo.flush()  # Asegura que los cambios se escriban en el disco.
         print(f"Constructor llamado: Archivo '{self.nombre_archivo}' creado y escrito con '{contenido_inicial}'.")
@@ -31,17 +33,25 @@ class ManejadorArchivo:
         print(f"Contenido leído: {contenido}")
         return contenido
 
-    def __del__(self):
+    def close(self):
         """
-        Destructor: Se ejecuta cuando el objeto se destruye.
+        Libera los recursos del objeto.
         - Cierra el archivo si está abierto.
         - Elimina el archivo del sistema para limpiar recursos.
         """
-        if hasattr(self, 'archivo') and not self.archivo.closed:
+        if not self.archivo.closed:
             self.archivo.close()  # Cierra el archivo.
         if os.path.exists(self.nombre_archivo):
             os.remove(self.nombre_archivo)  # Elimina el archivo.
-        print(f"Destructor llamado: Archivo '{self.nombre_archivo}' cerrado y eliminado.")
+        print(f"close() llamado: Archivo '{self.nombre_archivo}' cerrado y eliminado.")
+
+    def __enter__(self):
+        """Inicio del bloque with: devuelve el propio objeto."""
+        return self
+
+    def __exit__(self, *exc):
+        """Fin del bloque with: se liberan los recursos aunque haya ocurrido una excepción."""
+        self.close()
 
 
 # Demostración del programa
@@ -49,12 +59,9 @@ if __name__ == "__main__":
     print("Iniciando demostración...")
 
     # Crear una instancia: Llama al constructor.
-    manejador = ManejadorArchivo('mi archivo.txt', 'Prueba.')
-
-    # Usar el objeto: Leer el contenido.
-    manejador.leer_contenido()
-
-    # Eliminar la referencia explícitamente para forzar la llamada al destructor.
-    del manejador
+    # Al salir del bloque with se llama a close() automáticamente.
+    with ManejadorArchivo('mi archivo.txt', 'Prueba.') as manejador:
+        # Usar el objeto: Leer el contenido.
+        manejador.leer_contenido()
 
     print("Fin de la demostración.")
\ No newline at end of file
@@ -1,5 +1,9 @@
 # Sistema de gestion de inventarios
 
+import bisect
+import sys
+from array import array
+
 # CLASE PRODUCTO
 class Producto:
     """
@@ -8,67 +12,72 @@ class Producto:
     Decisiones de diseño:
     - El ID se almacena como entero para facilitar comparaciones y garantizar
       unicidad numérica. No se usa UUID para mantener el sistema simple.
-    - Se usan propiedades (@property) en lugar de métodos get/set explícitos,
-      que es la convención idiomática de Python.
+    - Los campos se exponen como atributos simples (sin @property) declarados
+      en __slots__: la lectura es directa y cada instancia ocupa menos memoria.
+      La validación se hace en __init__ con los validadores _validar_*.
+    - El nombre en minúsculas se calcula una sola vez (_nombre_lower) para
+      que las búsquedas no tengan que repetir str.lower() en cada consulta.
+      Por eso el nombre solo debe cambiarse con set_nombre(): asignar
+      p.nombre directamente dejaría _nombre_lower desactualizado.
     - El precio y la cantidad validan que no sean negativos, ya que un
       producto con precio o stock negativo carece de sentido de negocio.
     """
 
+    __slots__ = ("id_producto", "nombre", "cantidad", "precio", "_nombre_lower")
+
     def __init__(self, id_producto: int, nombre: str, cantidad: int, precio: float):
         """
         Constructor del producto.
-        Se llama a los setters desde el inicio para
-        aprovechar la validación centralizada en un solo lugar.
+        Cada valor pasa por su validador antes de asignarse, de modo que la
+        validación sigue centralizada en un solo lugar.
+        """
+        self.id_producto = Producto._validar_id(id_producto)
+        self.set_nombre(nombre)
+        self.cantidad = Producto._validar_cantidad(cantidad)
+        self.precio = Producto._validar_precio(precio)
+
+    @classmethod
+    def _from_trusted(cls, id_producto: int, nombre: str, nombre_lower: str,
+                      cantidad: int, precio: float) -> "Producto":
         """
-        self.id_producto = id_producto  # Usa el setter para validar
-        self.nombre = nombre
-        self.cantidad = cantidad
-        self.precio = precio
-
-    # ID
-    @property
-    def id_producto(self) -> int:
-        return self._id_producto
-
-    @id_producto.setter
-    def id_producto(self, valor: int):
+        Crea un producto SIN pasar por los validadores.
+        Solo para datos que ya fueron validados al guardarse (p. ej. las
+        columnas del Inventario); el resto del programa debe usar el
+        constructor normal.
+        """
+        p = cls.__new__(cls)
+        p.id_producto = id_producto
+        p.nombre = nombre
+        p._nombre_lower = nombre_lower
+        p.cantidad = cantidad
+        p.precio = precio
+        return p
+
+    # VALIDADORES
+    @staticmethod
+    def _validar_id(valor: int) -> int:
         # El ID debe ser un entero positivo; se rechaza cualquier otro valor.
         if not isinstance(valor, int) or valor <= 0:
             raise ValueError("El ID debe ser un entero positivo.")
-        self._id_producto = valor
-
-    # NOMBRE
-    @property
-    def nombre(self) -> str:
-        return self._nombre
+        return valor
 
-    @nombre.setter
-    def nombre(self, valor: str):
+    @staticmethod
+    def _validar_nombre(valor: str) -> str:
         # Se elimina el espacio en blanco extra y se verifica que no esté vacío.
         valor = valor.strip()
         if not valor:
             raise ValueError("El nombre del producto no puede estar vacío.")
-        self._nombre = valor
+        return valor
 
-    # CANTIDAD
-    @property
-    def cantidad(self) -> int:
-        return self._cantidad
-
-    @cantidad.setter
-    def cantidad(self, valor: int):
+    @staticmethod
+    def _validar_cantidad(valor: int) -> int:
         # Se permite 0 (producto agotado), pero no stock negativo.
         if not isinstance(valor, int) or valor < 0:
             raise ValueError("La cantidad debe ser un entero no negativo.")
-        self._cantidad = valor
-
-    # PRECIO
-    @property
-    def precio(self) -> float:
-        return self._precio
+        return valor
 
-    @precio.setter
-    def precio(self, valor: float):
+    @staticmethod
+    def _validar_precio(valor: float) -> float:
         # Convertimos implícitamente enteros a float para comodidad del usuario.
         try:
             valor = float(valor)
@@ -76,21 +85,31 @@ class Producto:
             raise ValueError("El precio debe ser un número.")
         if valor < 0:
             raise ValueError("El precio no puede ser negativo.")
-        self._precio = round(valor, 2)  # Redondeamos a 2 decimales (centavos)
+        return round(valor, 2)  # Redondeamos a 2 decimales (centavos)
+
+    # MODIFICADORES
+    def set_nombre(self, valor: str):
+        """
+        Cambia el nombre validándolo y actualiza su versión en minúsculas.
+        Es la única forma válida de modificar el nombre: no asignar
+        p.nombre directamente.
+        """
+        self.nombre = Producto._validar_nombre(valor)
+        self._nombre_lower = self.nombre.lower()
 
     # REPRESENTACIÓN
     def __str__(self) -> str:
         """Representación legible para mostrar en consola."""
         return (
-            f"  ID      : {self._id_producto}\n"
-            f"  Nombre  : {self._nombre}\n"
-            f"  Cantidad: {self._cantidad} unidades\n"
-            f"  Precio  : ${self._precio:.2f}"
+            f"  ID      : {self.id_producto}\n"
+            f"  Nombre  : {self.nombre}\n"
+            f"  Cantidad: {self.cantidad} unidades\n"
+            f"  Precio  : ${self.precio:.2f}"
         )
 
     def __repr__(self) -> str:
-        return (f"Producto(id={self._id_producto}, nombre='{self._nombre}', "
-                f"cantidad={self._cantidad}, precio={self._precio})")
+        return (f"Producto(id={self.id_producto}, nombre='{self.nombre}', "
+                f"cantidad={self.cantidad}, precio={self.precio})")
 
 
 # CLASE INVENTARIO
@@ -100,16 +119,52 @@ class Inventario:
     Gestiona la colección de productos de la tienda.
 
     Decisiones de diseño:
-    - Se usa un diccionario (dict) como estructura interna con el ID como clave.
-      Esto permite búsqueda por ID en O(1) frente a O(n) de una lista.
+    - Los datos se guardan en columnas paralelas (una por campo) en lugar de
+      un objeto Producto por registro: los recorridos de búsqueda y listado
+      leen columnas compactas. Los IDs y las cantidades van en listas (no en
+      array("q")) porque Python admite enteros de cualquier tamaño y un
+      array de 64 bits rechazaría valores que el programa sí acepta.
+    - Un diccionario {id_producto -> posición} permite búsqueda por ID en O(1)
+      frente a O(n) de recorrer la columna de IDs.
+    - Se mantiene además una lista de IDs siempre ordenada (bisect), de modo
+      que listar por ID no requiere ordenar en cada consulta.
     - La búsqueda por nombre devuelve una LISTA de resultados para cubrir el
       caso de nombres similares o duplicados (supuesto del enunciado).
     - La búsqueda por nombre es case-insensitive para mejorar la usabilidad.
     """
 
+    __slots__ = ("_ids", "_nombres", "_nombres_lower", "_cantidades",
+                 "_precios", "_pos", "_ids_ordenados")
+
     def __init__(self):
-        # Diccionario: { id_producto (int) -> Producto }
-        self._productos: dict[int, Producto] = {}
+        # Columnas paralelas: la posición i de cada una describe al mismo producto
+        self._ids: list[int] = []             # id_producto
+        self._nombres: list[str] = []         # nombre tal como se muestra
+        self._nombres_lower: list[str] = []   # nombre en minúsculas para buscar
+        self._cantidades: list[int] = []      # unidades en stock
+        self._precios = array("d")            # precio unitario
+        # Diccionario: { id_producto (int) -> posición en las columnas }
+        self._pos: dict[int, int] = {}
+        # IDs en orden ascendente, mantenidos con bisect en cada alta/baja
+        self._ids_ordenados: list[int] = []
+
+    def _fila(self, pos: int) -> Producto:
+        """
+        Reconstruye el Producto almacenado en la posición indicada.
+        Los valores ya se validaron al guardarse, así que no se repite la
+        validación del constructor.
+        """
+        return Producto._from_trusted(self._ids[pos], self._nombres[pos],
+                                      self._nombres_lower[pos],
+                                      self._cantidades[pos], self._precios[pos])
+
+    def _filas(self, posiciones) -> list[Producto]:
+        """Igual que _fila, pero para muchas posiciones de una sola vez."""
+        nuevo = Producto._from_trusted
+        ids, nombres, nombres_lower = self._ids, self._nombres, self._nombres_lower
+        cantidades, precios = self._cantidades, self._precios
+        return [nuevo(ids[i], nombres[i], nombres_lower[i], cantidades[i], precios[i])
+                for i in posiciones]
 
     # AÑADIR
     def añadir_producto(self, producto: Producto) -> bool:
@@ -119,9 +174,18 @@ class Inventario:
         Se prefiere retornar un booleano en lugar de lanzar una excepción
         porque la duplicación de ID es un flujo de usuario normal, no un error.
         """
-        if producto.id_producto in self._productos:
+        if producto.id_producto in self._pos:
             return False  # ID duplicado: no se añade
-        self._productos[producto.id_producto] = producto
+        pos = len(self._ids)
+        self._ids.append(producto.id_producto)
+        self._nombres.append(producto.nombre)
+        self._nombres_lower.append(producto._nombre_lower)
+        self._cantidades.append(producto.cantidad)
+        self._precios.append(producto.precio)
+        bisect.insort(self._ids_ordenados, producto.id_producto)
+        # El índice se registra al final, cuando todas las columnas ya
+        # tienen la fila completa
+        self._pos[producto.id_producto] = pos
         return True
 
     # ELIMINAR
@@ -129,10 +193,22 @@ class Inventario:
         """
         Elimina un producto por ID.
         Retorna True si se eliminó, False si no existía.
+        El último registro ocupa el hueco del eliminado (swap-pop), así
+        ninguna columna tiene que desplazar sus elementos: O(1).
         """
-        if id_producto not in self._productos:
+        pos = self._pos.pop(id_producto, None)  # Una sola búsqueda en el dict
+        if pos is None:
             return False
-        del self._productos[id_producto]
+        columnas = (self._ids, self._nombres, self._nombres_lower,
+                    self._cantidades, self._precios)
+        ultimo = len(self._ids) - 1
+        if pos != ultimo:
+            for columna in columnas:
+                columna[pos] = columna[ultimo]
+            self._pos[self._ids[pos]] = pos
+        for columna in columnas:
+            columna.pop()
+        self._ids_ordenados.pop(bisect.bisect_left(self._ids_ordenados, id_producto))
         return True
 
     # ACTUALIZAR
@@ -147,15 +223,24 @@ class Inventario:
         Acepta None en los parámetros para actualizar solo uno de los dos.
         Retorna True si se actualizó, False si el ID no existe.
         """
-        if id_producto not in self._productos:
+        pos = self._pos.get(id_producto)  # Una sola búsqueda en el dict
+        if pos is None:
             return False
-        producto = self._productos[id_producto]
+        # Se validan con las mismas reglas que el constructor de Producto
         if nueva_cantidad is not None:
-            producto.cantidad = nueva_cantidad  # El setter valida el valor
+            self._cantidades[pos] = Producto._validar_cantidad(nueva_cantidad)
         if nuevo_precio is not None:
-            producto.precio = nuevo_precio       # El setter valida el valor
+            self._precios[pos] = Producto._validar_precio(nuevo_precio)
         return True
 
+    # OBTENER POR ID
+    def obtener(self, id_producto: int) -> Producto | None:
+        """Devuelve el producto con ese ID en O(1), o None si no existe."""
+        pos = self._pos.get(id_producto)
+        if pos is None:
+            return None
+        return self._fila(pos)
+
     # BUSCAR POR NOMBRE
     def buscar_por_nombre(self, nombre: str) -> list[Producto]:
         """
@@ -166,24 +251,26 @@ class Inventario:
         parciales (p. ej., 'manz' encuentre 'Manzana roja').
         """
         termino = nombre.strip().lower()
-        return [p for p in self._productos.values()
-                if termino in p.nombre.lower()]
+        return self._filas([i for i, nl in enumerate(self._nombres_lower)
+                            if termino in nl])
 
     # MOSTRAR TODOS
     def mostrar_todos(self) -> list[Producto]:
         """
         Retorna la lista completa de productos ordenados por ID.
-        Se ordena por ID para presentar una visualización consistente.
+        Se ordena por ID para presentar una visualización consistente;
+        el orden ya está mantenido en _ids_ordenados, no se ordena aquí.
         """
-        return sorted(self._productos.values(), key=lambda p: p.id_producto)
+        pos = self._pos
+        return self._filas([pos[i] for i in self._ids_ordenados])
 
     def esta_vacio(self) -> bool:
         """Utilidad para verificar si el inventario no tiene productos."""
-        return len(self._productos) == 0
+        return len(self._ids) == 0
 
     def id_existe(self, id_producto: int) -> bool:
         """Comprueba si un ID ya está registrado (útil para la UI)."""
-        return id_producto in self._productos
+        return id_producto in self._pos
 
     def siguiente_id(self) -> int:
         """
@@ -192,7 +279,7 @@ class Inventario:
         """
         if self.esta_vacio():
             return 1
-        return max(self._productos.keys()) + 1
+        return self._ids_ordenados[-1] + 1
 
 
 # INTERFAZ DE USUARIO EN CONSOLA
@@ -219,8 +306,49 @@ def encabezado(titulo: str):
     print(LINEA)
 
 
+def _imprimir_productos(productos: list[Producto]):
+    """
+    Imprime una lista de productos separados por una línea.
+    Se arma todo el texto y se escribe con una sola llamada a la consola
+    en lugar de dos print() por producto.
+    """
+    bloques = [f"{p}\n  {SEPARADOR}\n" for p in productos]
+    sys.stdout.write("".join(bloques))
+
+
 # Funciones de entrada segura
 
+def convertir_entero(texto: str, minimo: int = None, maximo: int = None) -> int:
+    """
+    Convierte un texto en entero con validación de rango opcional.
+    No interactúa con el usuario, por lo que sirve también para cargar
+    datos en lote desde un script; lanza ValueError con el aviso a mostrar.
+    """
+    try:
+        valor = int(texto)
+    except ValueError:
+        raise ValueError("Entrada inválida. Ingrese un número entero.")
+    if minimo is not None and valor < minimo:
+        raise ValueError(f"Ingrese un valor mayor o igual a {minimo}.")
+    if maximo is not None and valor > maximo:
+        raise ValueError(f"Ingrese un valor menor o igual a {maximo}.")
+    return valor
+
+
+def convertir_flotante(texto: str, minimo: float = 0.0) -> float:
+    """
+    Convierte un texto en número decimal con validación de mínimo.
+    Igual que convertir_entero, lanza ValueError con el aviso a mostrar.
+    """
+    try:
+        valor = float(texto)
+    except ValueError:
+        raise ValueError("Entrada inválida. Ingrese un número (ej: 9.99).")
+    if valor < minimo:
+        raise ValueError(f"Ingrese un valor mayor o igual a {minimo}.")
+    return valor
+
+
 def pedir_entero(mensaje: str, minimo: int = None, maximo: int = None) -> int:
     """
     Solicita un entero al usuario con validación de rango opcional.
@@ -228,16 +356,9 @@ def pedir_entero(mensaje: str, minimo: int = None, maximo: int = None) -> int:
     """
     while True:
         try:
-            valor = int(input(mensaje))
-            if minimo is not None and valor < minimo:
-                print(f"  ⚠ Ingrese un valor mayor o igual a {minimo}.")
-                continue
-            if maximo is not None and valor > maximo:
-                print(f" ⚠ Ingrese un valor menor o igual a {maximo}.")
-                continue
-            return valor
-        except ValueError:
-            print("  ⚠ Entrada inválida. Ingrese un número entero.")
+            return convertir_entero(input(mensaje), minimo, maximo)
+        except ValueError as e:
+            print(f"  ⚠ {e}")
 
 
 def pedir_flotante(mensaje: str, minimo: float = 0.0) -> float:
@@ -246,13 +367,9 @@ def pedir_flotante(mensaje: str, minimo: float = 0.0) -> float:
     """
     while True:
         try:
-            valor = float(input(mensaje))
-            if valor < minimo:
-                print(f"  ⚠ Ingrese un valor mayor o igual a {minimo}.")
-                continue
-            return valor
-        except ValueError:
-            print("  ⚠ Entrada inválida. Ingrese un número (ej: 9.99).")
+            return convertir_flotante(input(mensaje), minimo)
+        except ValueError as e:
+            print(f"  ⚠ {e}")
 
 
 def pedir_texto(mensaje: str) -> str:
@@ -306,13 +423,13 @@ def op_eliminar(inventario: Inventario):
     id_p = pedir_entero("  ID del producto a eliminar: ", minimo=1)
 
     # Mostramos el producto antes de pedir confirmación
-    resultados = [p for p in inventario.mostrar_todos() if p.id_producto == id_p]
-    if not resultados:
+    producto = inventario.obtener(id_p)
+    if producto is None:
         print(f"\n  ✗ No se encontró ningún producto con ID {id_p}.")
         pausar()
         return
 
-    print(f"\n  Producto encontrado:\n{resultados[0]}")
+    print(f"\n  Producto encontrado:\n{producto}")
     confirmar = input("\n  ¿Confirma la eliminación? (s/n): ").strip().lower()
 
     if confirmar == "s":
@@ -335,13 +452,13 @@ def op_actualizar(inventario: Inventario):
 
     id_p = pedir_entero("  ID del producto a actualizar: ", minimo=1)
 
-    if not inventario.id_existe(id_p):
+    producto_actual = inventario.obtener(id_p)
+    if producto_actual is None:
         print(f"\n  ✗ No se encontró ningún producto con ID {id_p}.")
         pausar()
         return
 
     # Mostramos el estado actual para que el usuario sepa qué valores cambiar
-    producto_actual = [p for p in inventario.mostrar_todos() if p.id_producto == id_p][0]
     print(f"\n  Estado actual:\n{producto_actual}")
     print(f"\n  {SEPARADOR}")
     print("  Deje en blanco y presione Enter para mantener el valor actual.")
@@ -395,9 +512,7 @@ def op_buscar(inventario: Inventario):
         print(f"\n  ✗ No se encontraron productos que contengan '{termino}'.")
     else:
         print(f"\n  Se encontraron {len(resultados)} resultado(s):\n")
-        for p in resultados:
-            print(p)
-            print(f"  {SEPARADOR}")
+        _imprimir_productos(resultados)
 
     pausar()
 
@@ -413,10 +528,7 @@ def op_mostrar_todos(inventario: Inventario):
 
     productos = inventario.mostrar_todos()
     print(f"  Total de productos: {len(productos)}\n")
-
-    for p in productos:
-        print(p)
-        print(f"  {SEPARADOR}")
+    _imprimir_productos(productos)
 
     pausar()
 
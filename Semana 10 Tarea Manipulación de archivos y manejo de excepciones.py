@@ -1,18 +1,49 @@
 #  Sistema de Gestión de Inventarios 
 
 
+import bisect
 import csv
+import io
 import os
 import shutil
+import sys
 import tempfile
 
 # Ruta del archivo donde se persiste el inventario.
 # Se define como constante global para facilitar el cambio en el futuro.
 ARCHIVO_INVENTARIO = "inventario.txt"
 
+# Diario (journal) de cambios: cada alta/baja/modificación añade una línea
+# aquí en lugar de reescribir todo el inventario. Al cargar se reproduce
+# sobre la instantánea de ARCHIVO_INVENTARIO.
+ARCHIVO_DIARIO = "inventario.diario"
+
 # Cabecera del CSV 
 CABECERA_CSV = ["id", "nombre", "cantidad", "precio"]
 
+# Tamaño del búfer de E/S para leer y escribir la instantánea (1 MiB)
+TAMANO_BUFER = 1 << 20
+
+# Hasta este tamaño la instantánea se lee completa con una sola llamada a
+# read(); si es más grande se procesa en streaming con el búfer anterior.
+LIMITE_LECTURA_COMPLETA = 8 << 20
+
+# Máximo de búsquedas recordadas por Inventario antes de vaciar la caché
+MAX_BUSQUEDAS_CACHE = 32
+
+# A partir de esta cantidad de productos, las búsquedas de 3 o más letras
+# usan el índice de trigramas en lugar de recorrer todo el inventario.
+UMBRAL_INDICE_TRIGRAMAS = 200
+
+# Códigos de operación del diario
+OP_ALTA = "A"           # A,id,nombre,cantidad,precio
+OP_BAJA = "D"           # D,id
+OP_ACTUALIZACION = "U"  # U,id,cantidad,precio
+
+# Constantes de presentación de la consola
+LINEA     = "=" * 55
+SEPARADOR = "-" * 55
+
 
 
 # CLASE PRODUCTO  
@@ -28,14 +59,39 @@ class Producto:
     - Se usan propiedades (@property) en lugar de métodos get/set explícitos,
       que es la convención idiomática de Python.
     - El precio y la cantidad validan que no sean negativos.
+    - __slots__ evita el __dict__ por instancia (menos memoria por producto).
+    - El texto de __str__ se genera la primera vez que se pide y se reutiliza
+      (_str_cache); cualquier setter lo invalida.
     """
 
+    __slots__ = ("_id_producto", "_nombre", "_cantidad", "_precio", "_nombre_lower",
+                 "_str_cache")
+
     def __init__(self, id_producto: int, nombre: str, cantidad: int, precio: float):
         self.id_producto = id_producto
         self.nombre = nombre
         self.cantidad = cantidad
         self.precio = precio
 
+    @classmethod
+    def _from_trusted(cls, id_producto: int, nombre: str, cantidad: int,
+                      precio: float) -> "Producto":
+        """
+        Crea un producto SIN pasar por los setters.
+        Solo para datos que ya fueron convertidos y comprobados por quien
+        llama (p. ej. la carga del archivo); el resto del programa debe usar
+        el constructor normal. El precio se redondea a centavos igual que
+        en el setter, para que ambos caminos den el mismo producto.
+        """
+        p = cls.__new__(cls)
+        p._id_producto = id_producto
+        p._nombre = nombre
+        p._nombre_lower = nombre.lower()
+        p._cantidad = cantidad
+        p._precio = round(precio, 2)
+        p._str_cache = None
+        return p
+
     # ID 
     @property
     def id_producto(self) -> int:
@@ -46,6 +102,7 @@ class Producto:
         if not isinstance(valor, int) or valor <= 0:
             raise ValueError("El ID debe ser un entero positivo.")
         self._id_producto = valor
+        self._str_cache = None
 
     # NOMBRE 
     @property
@@ -58,6 +115,9 @@ class Producto:
         if not valor:
             raise ValueError("El nombre del producto no puede estar vacío.")
         self._nombre = valor
+        # Versión en minúsculas precalculada para las búsquedas por nombre
+        self._nombre_lower = valor.lower()
+        self._str_cache = None
 
     #  CANTIDAD 
     @property
@@ -69,6 +129,7 @@ class Producto:
         if not isinstance(valor, int) or valor < 0:
             raise ValueError("La cantidad debe ser un entero no negativo.")
         self._cantidad = valor
+        self._str_cache = None
 
     #  PRECIO 
     @property
@@ -84,15 +145,18 @@ class Producto:
         if valor < 0:
             raise ValueError("El precio no puede ser negativo.")
         self._precio = round(valor, 2)
+        self._str_cache = None
 
     #  REPRESENTACIÓN 
     def __str__(self) -> str:
-        return (
-            f"  ID      : {self._id_producto}\n"
-            f"  Nombre  : {self._nombre}\n"
-            f"  Cantidad: {self._cantidad} unidades\n"
-            f"  Precio  : ${self._precio:.2f}"
-        )
+        if self._str_cache is None:
+            self._str_cache = (
+                f"  ID      : {self._id_producto}\n"
+                f"  Nombre  : {self._nombre}\n"
+                f"  Cantidad: {self._cantidad} unidades\n"
+                f"  Precio  : ${self._precio:.2f}"
+            )
+        return self._str_cache
 
     def __repr__(self) -> str:
         return (f"Producto(id={self._id_producto}, nombre='{self._nombre}', "
@@ -108,14 +172,22 @@ def _ruta_archivo() -> str:
     return os.path.abspath(ARCHIVO_INVENTARIO)
 
 
+def _ruta_diario() -> str:
+    """Devuelve la ruta absoluta del diario de cambios."""
+    return os.path.abspath(ARCHIVO_DIARIO)
+
+
 def guardar_inventario(productos: dict) -> tuple[bool, str]:
     """
     Escribe TODO el inventario en el archivo CSV de forma segura.
+    Se usa para compactar: tras una instantánea completa el diario se vacía.
+    Las filas se escriben en el orden del diccionario; Inventario ya lo
+    mantiene ordenado por ID, así que aquí no se vuelve a ordenar.
 
     Estrategia de escritura segura (write-then-replace):
       1. Escribe en un archivo temporal dentro del mismo directorio.
       2. Si la escritura tiene éxito, reemplaza el archivo real de forma
-         atómica con shutil.move(). Esto evita corrupción parcial si el
+         atómica con os.replace(). Esto evita corrupción parcial si el
          proceso se interrumpe a mitad de la escritura.
 
     Retorna (True, mensaje_ok) o (False, mensaje_error).
@@ -125,18 +197,25 @@ def guardar_inventario(productos: dict) -> tuple[bool, str]:
 
     try:
         # Creamos el archivo temporal en el mismo directorio para que
-        # shutil.move() use rename() del SO.
+        # os.replace() sea un único rename() atómico del SO.
         fd, ruta_tmp = tempfile.mkstemp(dir=directorio, suffix=".tmp")
 
         try:
-            with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+            # Búfer de 1 MiB: el archivo completo se vuelca al disco con
+            # muy pocas llamadas al sistema en lugar de una cada 8 KiB.
+            with os.fdopen(fd, "w", newline="", encoding="utf-8",
+                           buffering=TAMANO_BUFER) as f:
                 writer = csv.writer(f)
                 writer.writerow(CABECERA_CSV)   # Cabecera
-                for p in sorted(productos.values(), key=lambda x: x.id_producto):
-                    writer.writerow([p.id_producto, p.nombre, p.cantidad, p.precio])
+                # Tuplas (más baratas de crear que listas) con los atributos
+                # internos, sin pasar por las propiedades en cada fila.
+                writer.writerows(
+                    (p._id_producto, p._nombre, p._cantidad, p._precio)
+                    for p in productos.values()
+                )
 
             # Reemplazamos el archivo real con el temporal 
-            shutil.move(ruta_tmp, ruta)
+            os.replace(ruta_tmp, ruta)
 
         except Exception:
             # Si algo falla durante la escritura eliminamos el temporal
@@ -156,7 +235,153 @@ def guardar_inventario(productos: dict) -> tuple[bool, str]:
         return False, f"Error inesperado al guardar el inventario: {e}"
 
 
-def cargar_inventario() -> tuple[dict, list[str]]:
+def registrar_cambio(fila: list) -> tuple[bool, str]:
+    """
+    Añade UNA línea al final del diario de cambios.
+
+    Escribir solo el cambio cuesta lo mismo sin importar cuántos productos
+    haya, en lugar de reescribir el inventario completo en cada operación.
+
+    Retorna (True, mensaje_ok) o (False, mensaje_error).
+    """
+    # La línea se serializa completa en memoria y se escribe con un solo write()
+    linea = io.StringIO()
+    csv.writer(linea).writerow(fila)
+    ruta = _ruta_diario()
+    try:
+        with open(ruta, "a", newline="", encoding="utf-8", buffering=1 << 16) as f:
+            f.write(linea.getvalue())
+        return True, f"Cambio registrado en '{ruta}'."
+    except PermissionError:
+        return False, (f"Sin permiso de escritura en '{ruta}'. "
+                       "Verifique los permisos del archivo o directorio.")
+    except OSError as e:
+        return False, f"Error del sistema operativo al guardar: {e}"
+
+
+def vaciar_diario() -> tuple[bool, str]:
+    """
+    Elimina el diario de cambios (tras una compactación exitosa).
+    Retorna (True, mensaje_ok) o (False, mensaje_error).
+    """
+    ruta = _ruta_diario()
+    try:
+        if os.path.exists(ruta):
+            os.remove(ruta)
+        return True, f"Diario '{ruta}' vaciado."
+    except OSError as e:
+        return False, f"No se pudo vaciar el diario '{ruta}': {e}"
+
+
+def _reproducir_diario(productos: dict, advertencias: list[str]) -> int:
+    """
+    Aplica sobre `productos` los cambios registrados en el diario, en orden.
+
+    Cada operación deja el producto en un estado absoluto (no suma ni resta),
+    por lo que reproducir un diario que ya estaba incluido en la instantánea
+    (p. ej. si el programa se cerró durante una compactación) da el mismo
+    resultado.
+
+    Retorna la cantidad de líneas que tenía el diario.
+    """
+    ruta = _ruta_diario()
+    if not os.path.exists(ruta):
+        return 0
+
+    lineas = 0
+    try:
+        with open(ruta, "r", newline="", encoding="utf-8") as f:
+            for numero_linea, fila in enumerate(csv.reader(f), start=1):
+                if not fila:
+                    continue
+                lineas += 1
+                try:
+                    op, id_p = fila[0], int(fila[1])
+                    if op == OP_ALTA and len(fila) == 5:
+                        productos[id_p] = Producto(id_p, fila[2], int(fila[3]), float(fila[4]))
+                    elif op == OP_BAJA and len(fila) == 2:
+                        if productos.pop(id_p, None) is None:
+                            raise ValueError(f"no existe el ID {id_p}.")
+                    elif op == OP_ACTUALIZACION and len(fila) == 4:
+                        producto = productos.get(id_p)
+                        if producto is None:
+                            raise ValueError(f"no existe el ID {id_p}.")
+                        producto.cantidad = int(fila[2])
+                        producto.precio = float(fila[3])
+                    else:
+                        raise ValueError(f"operación no reconocida: {fila}")
+                except (ValueError, IndexError) as e:
+                    advertencias.append(
+                        f"Diario, línea {numero_linea} ignorada: {e}"
+                    )
+    except OSError as e:
+        advertencias.append(
+            f"Error del sistema operativo al leer el diario '{ruta}': {e}."
+        )
+
+    return lineas
+
+
+def cargar_inventario() -> tuple[dict, list[str], int]:
+    """
+    Reconstruye el inventario: lee la instantánea CSV y luego reproduce
+    el diario de cambios sobre ella.
+
+    Retorna (dict_productos, lista_de_advertencias, lineas_del_diario).
+    """
+    productos, advertencias = _cargar_instantanea()
+    lineas_diario = _reproducir_diario(productos, advertencias)
+    return productos, advertencias, lineas_diario
+
+
+def _comprobar_rangos(id_p: int, nombre: str, cantidad: int, precio: float):
+    """
+    Comprueba los rangos de una fila ya convertida, con los mismos mensajes
+    que los setters de Producto. Lanza ValueError en el primer fallo.
+    """
+    if id_p <= 0:
+        raise ValueError("El ID debe ser un entero positivo.")
+    if not nombre:
+        raise ValueError("El nombre del producto no puede estar vacío.")
+    if cantidad < 0:
+        raise ValueError("La cantidad debe ser un entero no negativo.")
+    if precio < 0:
+        raise ValueError("El precio no puede ser negativo.")
+
+
+def _parseo_rapido(datos: str) -> dict | None:
+    """
+    Intenta convertir el contenido completo del CSV en un solo paso, con
+    str.split y comprensiones, sin la máquina de estados de csv.reader.
+
+    Solo sirve para el caso común de un archivo limpio: si hay comillas
+    (campos con comas), filas mal formadas, valores fuera de rango o IDs
+    duplicados, retorna None y quien llama usa el recorrido fila por fila,
+    que informa cada problema en las advertencias.
+    """
+    if '"' in datos:
+        return None
+    lineas = datos.splitlines()
+    if not lineas or lineas[0] != ",".join(CABECERA_CSV):
+        return None
+    try:
+        filas = [
+            (int(a), b.strip(), int(c), float(d))
+            for a, b, c, d in (ln.split(",", 3) for ln in lineas[1:] if ln)
+        ]
+        # Mismas reglas que el recorrido fila por fila, antes de redondear
+        # el precio (como el setter)
+        for fila in filas:
+            _comprobar_rangos(*fila)
+    except ValueError:
+        return None
+    productos = {fila[0]: Producto._from_trusted(*fila) for fila in filas}
+    if len(productos) != len(filas):
+        return None
+    return productos
+
+
+def _cargar_instantanea() -> tuple[dict, list[str]]:
     """
     Lee el archivo CSV y reconstruye el diccionario de productos.
 
@@ -176,26 +401,32 @@ def cargar_inventario() -> tuple[dict, list[str]]:
 
     #  Caso 1: El archivo no existe 
     if not os.path.exists(ruta):
-        advertencias.append(
-            f"Archivo '{ruta}' no encontrado. Se creará uno nuevo al guardar."
-        )
-        return productos, advertencias
-
-    # Caso 2: No tenemos permiso de lectura 
-    try:
-        f_test = open(ruta, "r", encoding="utf-8")
-        f_test.close()
-    except PermissionError:
-        advertencias.append(
-            f"Sin permiso de lectura sobre '{ruta}'. "
-            "El inventario comenzará vacío."
-        )
+        if os.path.exists(_ruta_diario()):
+            # Sin instantánea pero con diario: los datos salen solo del diario
+            advertencias.append(
+                f"Archivo '{ruta}' no encontrado. El inventario se reconstruye "
+                f"desde el diario '{_ruta_diario()}' y el archivo se creará "
+                "con el próximo cambio."
+            )
+        else:
+            advertencias.append(
+                f"Archivo '{ruta}' no encontrado. Se creará uno nuevo al guardar."
+            )
         return productos, advertencias
 
-    # Caso 3: Lectura normal con tolerancia a errores 
+    # Caso 2: Lectura normal con tolerancia a errores. Si no hay permiso
+    # de lectura, el propio open() lanza PermissionError (ver más abajo).
     try:
-        with open(ruta, "r", newline="", encoding="utf-8") as f:
-            reader = csv.reader(f)
+        with open(ruta, "r", newline="", encoding="utf-8", buffering=TAMANO_BUFER) as f:
+            if os.fstat(f.fileno()).st_size <= LIMITE_LECTURA_COMPLETA:
+                # Un solo read(): el parseo posterior trabaja en memoria
+                datos = f.read()
+                rapidos = _parseo_rapido(datos)
+                if rapidos is not None:
+                    return rapidos, advertencias
+                reader = csv.reader(io.StringIO(datos))
+            else:
+                reader = csv.reader(f)
 
             # Verificamos la cabecera
             try:
@@ -226,11 +457,14 @@ def cargar_inventario() -> tuple[dict, list[str]]:
                             f"Se esperaban 4 columnas, se encontraron {len(fila)}."
                         )
                     id_p     = int(fila[0])
-                    nombre   = fila[1]
+                    nombre   = fila[1].strip()
                     cantidad = int(fila[2])
                     precio   = float(fila[3])
 
-                    p = Producto(id_p, nombre, cantidad, precio)
+                    # Los valores ya están convertidos: basta comprobar los
+                    # rangos aquí y crear el producto sin repetir los setters.
+                    _comprobar_rangos(id_p, nombre, cantidad, precio)
+                    p = Producto._from_trusted(id_p, nombre, cantidad, precio)
 
                     if id_p in productos:
                         advertencias.append(
@@ -245,6 +479,12 @@ def cargar_inventario() -> tuple[dict, list[str]]:
                         f"Fila {numero_fila} ignorada (dato inválido): {e}"
                     )
 
+    except PermissionError:
+        advertencias.append(
+            f"Sin permiso de lectura sobre '{ruta}'. "
+            "El inventario comenzará vacío."
+        )
+        return {}, advertencias
     except OSError as e:
         advertencias.append(
             f"Error del sistema operativo al leer '{ruta}': {e}. "
@@ -256,6 +496,12 @@ def cargar_inventario() -> tuple[dict, list[str]]:
 
 
 
+def _trigramas_de(texto: str) -> set[str]:
+    """Devuelve el conjunto de subcadenas de 3 caracteres de `texto`."""
+    return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+
+
 # CLASE INVENTARIO  (con persistencia en archivo)
 
 
@@ -265,26 +511,188 @@ class Inventario:
 
     Cambios respecto a v1:
     - __init__ llama a cargar_inventario() para reconstruir el estado desde
-      el archivo al arrancar el programa.
-    - añadir_producto, eliminar_producto y actualizar_producto llaman a
-      _persistir() justo después de cada modificación exitosa.
-    - _persistir() delega en guardar_inventario() y retorna el resultado
-      para que la UI pueda informar al usuario.
+      el archivo (instantánea + diario) al arrancar el programa.
+    - añadir_producto, eliminar_producto y actualizar_producto validan el
+      cambio y lo registran en el diario con _registrar() (una sola línea,
+      sin reescribir todo el archivo); solo si se guardó se aplica en
+      memoria, así que un fallo de escritura no requiere revertir nada.
+    - Cuando el diario supera el doble de productos, _persistir() escribe
+      una instantánea completa con guardar_inventario() y vacía el diario
+      (compactación).
+    - buscar_por_nombre recuerda los resultados recientes: si una consulta
+      contiene a otra ya hecha ("man" → "manz"), solo se filtran los
+      resultados anteriores. La caché se vacía al añadir o eliminar.
+    - El diccionario de productos se mantiene ordenado por ID (los dict
+      conservan el orden de inserción), por lo que listar o guardar no
+      necesita ordenar cada vez.
+    - Un índice de trigramas {subcadena de 3 letras -> IDs} reduce las
+      búsquedas en inventarios grandes a los productos que contienen todos
+      los trigramas del término; luego se confirma la subcadena completa.
+    - En inventarios chicos todos los nombres se unen en un solo texto
+      separado por "\\0" y se busca con str.find (un recorrido en C) en lugar
+      de evaluar `in` producto por producto. El texto se rehace al cambiar.
     """
 
     def __init__(self):
         # Cargamos el inventario desde disco; guardamos las advertencias
         # para que main() las muestre al usuario al arrancar.
-        self._productos, self.advertencias_carga = cargar_inventario()
+        productos, self.advertencias_carga, self._lineas_diario = cargar_inventario()
+        # Si aún no hay instantánea, el primer cambio la crea (ver _registrar)
+        self._hay_instantanea: bool = os.path.exists(_ruta_archivo())
+        # Se ordena una sola vez al cargar; luego cada alta conserva el orden
+        self._productos: dict[int, Producto] = dict(sorted(productos.items()))
+        # ID más alto registrado; evita recorrer todas las claves en siguiente_id()
+        self._max_id: int = max(self._productos, default=0)
+        # Caché de búsquedas: { término en minúsculas -> productos encontrados }
+        self._busquedas: dict[str, list[Producto]] = {}
+        # Índice de trigramas: { trigrama del nombre en minúsculas -> IDs }
+        self._trigramas: dict[str, set[int]] = {}
+        for producto in self._productos.values():
+            self._indexar(producto)
+        # Nombres concatenados para buscar con un solo str.find; se construye
+        # al buscar y se descarta (None) al añadir o eliminar productos.
+        self._bloque_nombres: str | None = None
+        self._inicios_bloque: list[int] = []   # posición donde empieza cada nombre
+        self._productos_bloque: list[Producto] = []
+
+    def _indexar(self, producto: Producto):
+        """Agrega los trigramas del nombre del producto al índice."""
+        for trigrama in _trigramas_de(producto._nombre_lower):
+            self._trigramas.setdefault(trigrama, set()).add(producto._id_producto)
+
+    def _desindexar(self, producto: Producto):
+        """Quita los trigramas del nombre del producto del índice."""
+        for trigrama in _trigramas_de(producto._nombre_lower):
+            ids = self._trigramas[trigrama]
+            ids.discard(producto._id_producto)
+            if not ids:
+                del self._trigramas[trigrama]
+
+    def _candidatos_trigramas(self, termino: str) -> list[Producto]:
+        """
+        Productos cuyo nombre contiene TODOS los trigramas de `termino`
+        (en orden de ID). Es un superconjunto de los resultados: quien llama
+        confirma después que el término completo esté en el nombre.
+        """
+        listas = []
+        for trigrama in _trigramas_de(termino):
+            ids = self._trigramas.get(trigrama)
+            if not ids:
+                return []
+            listas.append(ids)
+        listas.sort(key=len)  # Se intersecta empezando por la lista más corta
+        ids = listas[0].intersection(*listas[1:])
+        return [self._productos[i] for i in sorted(ids)]
+
+    def _buscar_en_bloque(self, termino: str) -> list[Producto]:
+        """
+        Busca `termino` en el texto con todos los nombres (en orden de ID).
+        Cada coincidencia se ubica en su producto con bisect sobre las
+        posiciones de inicio, y la búsqueda continúa desde el nombre siguiente.
+        """
+        if not termino:
+            return list(self._productos.values())
+        if "\0" in termino:
+            return []  # El separador nunca forma parte de un nombre
+        if self._bloque_nombres is None:
+            self._productos_bloque = list(self._productos.values())
+            self._inicios_bloque = []
+            posicion = 0
+            for p in self._productos_bloque:
+                self._inicios_bloque.append(posicion)
+                posicion += len(p._nombre_lower) + 1
+            self._bloque_nombres = "\0".join(p._nombre_lower for p in self._productos_bloque)
+
+        bloque, inicios = self._bloque_nombres, self._inicios_bloque
+        resultado = []
+        pos = bloque.find(termino)
+        while pos != -1:
+            k = bisect.bisect_right(inicios, pos) - 1
+            resultado.append(self._productos_bloque[k])
+            if k + 1 == len(inicios):
+                break
+            pos = bloque.find(termino, inicios[k + 1])
+        return resultado
+
+    def _insertar(self, producto: Producto):
+        """
+        Inserta un producto manteniendo el diccionario ordenado por ID.
+        Con IDs crecientes (el caso habitual) basta con agregarlo al final;
+        solo si el ID es menor que el último se reordena el diccionario.
+        """
+        self._productos[producto.id_producto] = producto
+        self._indexar(producto)
+        self._bloque_nombres = None
+        if producto.id_producto < self._max_id:
+            self._productos = dict(sorted(self._productos.items()))
+        else:
+            self._max_id = producto.id_producto
+
+    def _quitar(self, id_producto: int) -> Producto:
+        """
+        Quita un producto del diccionario y lo retorna.
+        Solo si era el de mayor ID se busca el nuevo máximo, que por estar
+        el diccionario ordenado es simplemente la última clave.
+        """
+        producto = self._productos.pop(id_producto)
+        self._desindexar(producto)
+        self._bloque_nombres = None
+        if id_producto == self._max_id:
+            self._max_id = next(reversed(self._productos), 0)
+        return producto
 
     # PERSISTENCIA INTERNA 
 
     def _persistir(self) -> tuple[bool, str]:
         """
-        Guarda el estado actual en disco.
-        Retorna (éxito, mensaje) para informar a la UI.
+        Guarda el estado actual completo en disco y vacía el diario.
+        Retorna (éxito, mensaje) para informar a la UI; si la instantánea
+        se guardó pero el diario no se pudo vaciar, también es un fallo.
+        """
+        ok, msg = guardar_inventario(self._productos)
+        if not ok:
+            return ok, msg
+        vaciado, msg_diario = vaciar_diario()
+        if not vaciado:
+            return False, msg_diario
+        self._lineas_diario = 0
+        self._hay_instantanea = True
+        return ok, msg
+
+    def _registrar(self, fila: list) -> tuple[bool, str]:
+        """
+        Registra un cambio en el diario ANTES de aplicarlo en memoria.
+        Si la escritura falla el inventario en memoria no se tocó, así que
+        no hay nada que revertir.
+        Si todavía no existe la instantánea, antes se guarda el estado actual
+        con _persistir(), así el archivo de inventario existe desde el primer
+        cambio. Si eso falla, el diario alcanza por sí solo y se reintenta
+        con el siguiente cambio.
+        Retorna (éxito, mensaje) del registro del cambio.
         """
-        return guardar_inventario(self._productos)
+        if not self._hay_instantanea:
+            self._persistir()
+        ok, msg = registrar_cambio(fila)
+        if ok:
+            self._lineas_diario += 1
+        return ok, msg
+
+    def _compactar_si_conviene(self) -> str:
+        """
+        Escribe una instantánea completa cuando el diario ya es más largo
+        que el doble del inventario. El cambio ya quedó guardado en el
+        diario, así que un fallo aquí no lo pierde: se reinicia el contador
+        para no reescribir todo el archivo en cada cambio siguiente, y el
+        reintento llega cuando el diario vuelva a crecer lo mismo.
+        Retorna un aviso para agregar al mensaje de la operación, o "".
+        """
+        if self._lineas_diario <= 2 * len(self._productos):
+            return ""
+        ok, msg = self._persistir()
+        if ok:
+            return ""
+        self._lineas_diario = 0
+        return f" Aviso: no se pudo compactar el diario ({msg})."
 
     # AÑADIR 
 
@@ -296,15 +704,16 @@ class Inventario:
         if producto.id_producto in self._productos:
             return False, f"ID {producto.id_producto} ya existe en el inventario."
 
-        self._productos[producto.id_producto] = producto
-        ok, msg = self._persistir()
-        if ok:
-            return True, f"Producto '{producto.nombre}' añadido y guardado con éxito."
-        else:
-            # Revertimos el cambio en memoria si no se pudo guardar
-            del self._productos[producto.id_producto]
+        ok, msg = self._registrar([OP_ALTA, producto.id_producto, producto.nombre,
+                                   producto.cantidad, producto.precio])
+        if not ok:
             return False, f"No se pudo guardar el inventario: {msg}"
 
+        self._busquedas.clear()
+        self._insertar(producto)
+        aviso = self._compactar_si_conviene()
+        return True, f"Producto '{producto.nombre}' añadido y guardado con éxito.{aviso}"
+
     #  ELIMINAR 
 
     def eliminar_producto(self, id_producto: int) -> tuple[bool, str]:
@@ -315,16 +724,15 @@ class Inventario:
         if id_producto not in self._productos:
             return False, f"No existe ningún producto con ID {id_producto}."
 
-        # Guardamos copia para poder revertir si falla el guardado
-        producto_backup = self._productos.pop(id_producto)
-        ok, msg = self._persistir()
-        if ok:
-            return True, f"Producto con ID {id_producto} eliminado y guardado con éxito."
-        else:
-            # Revertimos
-            self._productos[id_producto] = producto_backup
+        ok, msg = self._registrar([OP_BAJA, id_producto])
+        if not ok:
             return False, f"No se pudo guardar el inventario: {msg}"
 
+        self._busquedas.clear()
+        self._quitar(id_producto)
+        aviso = self._compactar_si_conviene()
+        return True, f"Producto con ID {id_producto} eliminado y guardado con éxito.{aviso}"
+
     #  ACTUALIZAR 
 
     def actualizar_producto(
@@ -342,33 +750,60 @@ class Inventario:
 
         producto = self._productos[id_producto]
 
-        # Guardamos valores anteriores para poder revertir
-        cantidad_anterior = producto.cantidad
-        precio_anterior   = producto.precio
-
+        # Se validan los valores nuevos con los mismos setters, pero sobre
+        # una copia: el producto real solo cambia si el diario se guardó.
+        candidato = Producto._from_trusted(producto.id_producto, producto.nombre,
+                                           producto.cantidad, producto.precio)
         if nueva_cantidad is not None:
-            producto.cantidad = nueva_cantidad
+            candidato.cantidad = nueva_cantidad
         if nuevo_precio is not None:
-            producto.precio = nuevo_precio
+            candidato.precio = nuevo_precio
 
-        ok, msg = self._persistir()
-        if ok:
-            return True, "Producto actualizado y guardado con éxito."
-        else:
-            # Revertimos los valores en memoria
-            producto.cantidad = cantidad_anterior
-            producto.precio   = precio_anterior
+        # Si los valores (ya normalizados) no cambian, no se toca el disco
+        if (candidato.cantidad == producto.cantidad
+                and candidato.precio == producto.precio):
+            return True, "El producto ya tenía esos valores; no se realizaron cambios."
+
+        ok, msg = self._registrar([OP_ACTUALIZACION, id_producto,
+                                   candidato.cantidad, candidato.precio])
+        if not ok:
             return False, f"No se pudo guardar el inventario: {msg}"
 
+        producto.cantidad = candidato.cantidad
+        producto.precio = candidato.precio
+        aviso = self._compactar_si_conviene()
+        return True, f"Producto actualizado y guardado con éxito.{aviso}"
+
     #  CONSULTAS 
 
     def buscar_por_nombre(self, nombre: str) -> list[Producto]:
         termino = nombre.strip().lower()
-        return [p for p in self._productos.values()
-                if termino in p.nombre.lower()]
+        resultado = self._busquedas.get(termino)
+        if resultado is None:
+            # Si una búsqueda anterior es subcadena del término actual, todo
+            # resultado nuevo está entre los suyos: se filtra solo esa lista.
+            base = max((clave for clave in self._busquedas if clave in termino),
+                       key=len, default=None)
+            if base is not None:
+                resultado = [p for p in self._busquedas[base]
+                             if termino in p._nombre_lower]
+            elif (len(termino) >= 3
+                  and len(self._productos) >= UMBRAL_INDICE_TRIGRAMAS):
+                resultado = [p for p in self._candidatos_trigramas(termino)
+                             if termino in p._nombre_lower]
+            else:
+                resultado = self._buscar_en_bloque(termino)
+            if len(self._busquedas) >= MAX_BUSQUEDAS_CACHE:
+                self._busquedas.clear()
+            self._busquedas[termino] = resultado
+        return list(resultado)
 
     def mostrar_todos(self) -> list[Producto]:
-        return sorted(self._productos.values(), key=lambda p: p.id_producto)
+        return list(self._productos.values())
+
+    def obtener(self, id_producto: int) -> Producto | None:
+        """Devuelve el producto con ese ID, o None si no existe (O(1))."""
+        return self._productos.get(id_producto)
 
     def esta_vacio(self) -> bool:
         return len(self._productos) == 0
@@ -377,19 +812,13 @@ class Inventario:
         return id_producto in self._productos
 
     def siguiente_id(self) -> int:
-        if self.esta_vacio():
-            return 1
-        return max(self._productos.keys()) + 1
+        return self._max_id + 1
 
 
 
 # INTERFAZ DE USUARIO EN CONSOLA
 
 
-LINEA     = "=" * 55
-SEPARADOR = "-" * 55
-
-
 def limpiar_pantalla():
     print("\n" * 2)
 
@@ -413,6 +842,14 @@ def _mostrar_resultado(ok: bool, mensaje: str):
     print(f"\n  {icono} {mensaje}")
 
 
+def _imprimir_productos(productos: list[Producto]):
+    """
+    Imprime una lista de productos separados por una línea, armando todo
+    el texto y escribiéndolo con una sola llamada a la consola.
+    """
+    sys.stdout.write("".join(f"{p}\n  {SEPARADOR}\n" for p in productos))
+
+
 #  Funciones de entrada segura 
 
 def pedir_entero(mensaje: str, minimo: int = None, maximo: int = None) -> int:
@@ -489,13 +926,13 @@ def op_eliminar(inventario: Inventario):
 
     id_p = pedir_entero("  ID del producto a eliminar: ", minimo=1)
 
-    resultados = [p for p in inventario.mostrar_todos() if p.id_producto == id_p]
-    if not resultados:
+    producto = inventario.obtener(id_p)
+    if producto is None:
         _mostrar_resultado(False, f"No se encontró ningún producto con ID {id_p}.")
         pausar()
         return
 
-    print(f"\n  Producto encontrado:\n{resultados[0]}")
+    print(f"\n  Producto encontrado:\n{producto}")
     confirmar = input("\n  ¿Confirma la eliminación? (s/n): ").strip().lower()
 
     if confirmar == "s":
@@ -518,12 +955,12 @@ def op_actualizar(inventario: Inventario):
 
     id_p = pedir_entero("  ID del producto a actualizar: ", minimo=1)
 
-    if not inventario.id_existe(id_p):
+    producto_actual = inventario.obtener(id_p)
+    if producto_actual is None:
         _mostrar_resultado(False, f"No se encontró ningún producto con ID {id_p}.")
         pausar()
         return
 
-    producto_actual = [p for p in inventario.mostrar_todos() if p.id_producto == id_p][0]
     print(f"\n  Estado actual:\n{producto_actual}")
     print(f"\n  {SEPARADOR}")
     print("  Deje en blanco y presione Enter para mantener el valor actual.")
@@ -577,9 +1014,7 @@ def op_buscar(inventario: Inventario):
         _mostrar_resultado(False, f"No se encontraron productos que contengan '{termino}'.")
     else:
         print(f"\n  Se encontraron {len(resultados)} resultado(s):\n")
-        for p in resultados:
-            print(p)
-            print(f"  {SEPARADOR}")
+        _imprimir_productos(resultados)
 
     pausar()
 
@@ -595,11 +1030,8 @@ def op_mostrar_todos(inventario: Inventario):
 
     productos = inventario.mostrar_todos()
     print(f"  Total de productos: {len(productos)}\n")
-    print(f"  Archivo: {_ruta_archivo()}\n")
-
-    for p in productos:
-        print(p)
-        print(f"  {SEPARADOR}")
+    print(f"  Archivos: {_ruta_archivo()} (+ diario {_ruta_diario()})\n")
+    _imprimir_productos(productos)
 
     pausar()
 
@@ -617,6 +1049,16 @@ def mostrar_menu():
     print(LINEA)
 
 
+# Tabla de despacho del menú: opción -> operación (se construye una sola vez)
+OPERACIONES_MENU = {
+    "1": op_añadir,
+    "2": op_eliminar,
+    "3": op_actualizar,
+    "4": op_buscar,
+    "5": op_mostrar_todos,
+}
+
+
 
 # PUNTO DE ENTRADA
 
@@ -626,18 +1068,21 @@ def main():
     Función principal.
 
     Al iniciar:
-      1. Se carga el inventario desde inventario.txt (si existe).
+      1. Se carga el inventario desde inventario.txt y se le aplican los
+         cambios de inventario.diario (si existen).
       2. Se muestran las advertencias de carga (filas corruptas, etc.).
       3. Si el archivo está vacío/inexistente se ofrecen datos de ejemplo.
 
     Al salir:
-      El inventario ya está persistido porque cada operación guarda
-      inmediatamente; no se necesita un guardado final explícito.
+      El inventario ya está persistido porque cada operación registra su
+      cambio en el diario inmediatamente; no se necesita un guardado final
+      explícito.
     """
     print(f"\n{LINEA}")
     print("  SISTEMA DE GESTIÓN DE INVENTARIOS  v2.0")
     print(f"{LINEA}")
-    print(f"  Cargando inventario desde '{ARCHIVO_INVENTARIO}'...")
+    print(f"  Cargando inventario desde '{ARCHIVO_INVENTARIO}' y "
+          f"'{ARCHIVO_DIARIO}'...")
 
     inventario = Inventario()
 
@@ -650,9 +1095,9 @@ def main():
     # Informamos cuántos productos se cargaron
     n = len(inventario.mostrar_todos())
     if n > 0:
-        print(f"\n  ✔ Se cargaron {n} producto(s) desde el archivo.")
+        print(f"\n  ✔ Se cargaron {n} producto(s) desde el inventario y su diario.")
     else:
-        print("\n  El archivo está vacío o no existe aún.")
+        print("\n  El inventario está vacío o sus archivos no existen aún.")
         # Si no hay datos, ofrecemos cargar ejemplos
         cargar_ej = input(
             "  ¿Desea cargar productos de ejemplo? (s/n): "
@@ -676,16 +1121,9 @@ def main():
         mostrar_menu()
         opcion = input("  Seleccione una opción: ").strip()
 
-        if opcion == "1":
-            op_añadir(inventario)
-        elif opcion == "2":
-            op_eliminar(inventario)
-        elif opcion == "3":
-            op_actualizar(inventario)
-        elif opcion == "4":
-            op_buscar(inventario)
-        elif opcion == "5":
-            op_mostrar_todos(inventario)
+        operacion = OPERACIONES_MENU.get(opcion)
+        if operacion is not None:
+            operacion(inventario)
         elif opcion == "0":
             print("\n  ¡Hasta luego! Sistema cerrado correctamente.\n")
             break